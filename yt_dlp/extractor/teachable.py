@@ -1,4 +1,5 @@
 import re
+import weakref
 
 from .common import InfoExtractor
 from .wistia import WistiaIE
@@ -12,6 +13,32 @@
     urljoin,
 )
 
+_IS_LOGGED_RE = re.compile(r'''(?x)
+    class=["']user-signout|
+    <a[^>]+\bhref=["']/sign_out|
+    Log\s+[Oo]ut\s*<''')
+_LOGIN_HEADERS_TEMPLATE = {'Content-Type': 'application/x-www-form-urlencoded'}
+_LOGIN_FORM_ACTION_RE = re.compile(r'<form[^>]+action=(["\'])(?P<url>(?:(?!\1).)+)\1')
+_TEACHABLE_CDN_RE = re.compile(r'<link[^>]+href=["\']https?://(?:process\.fs|assets)\.teachablecdn\.com')
+_COURSE_URL_RE = re.compile(r'https?://[^/]+/(?:courses|p)')
+_LECTURE_LOCKED_RE = re.compile(r'''(?x)
+    class=["']lecture-contents-locked|
+    >\s*Lecture\ contents\ locked|
+    id=["']lecture-locked|
+    # https://academy.tailoredtutors.co.uk/courses/108779/lectures/1955313
+    class=["'](?:inner-)?lesson-locked|
+    >LESSON\ LOCKED<''')
+_SECTION_POSITION_RE = re.compile(r'data-ss-position=["\'](\d+)')
+_SECTION_TITLE_RE = re.compile(r'(?s)<div[^>]+\bclass=["\']section-title[^>]+>(.+?)</div>')
+_COURSE_LI_RE = re.compile(r'(?s)(?P<li><li[^>]+class=(["\'])(?:(?!\2).)*?section-item[^>]+>.+?</li>)')
+_TIMESTAMP_RE = re.compile(r'\d{1,2}:\d{2}')
+_LECTURE_LINK_RE = re.compile(r'<a[^>]+href=(["\'])(?P<url>(?:(?!\1).)+)\1')
+_LECTURE_ID_RE = re.compile(r'/lectures/(\d+)')
+_LECTURE_NAME_RE = re.compile(r'<span[^>]+class=["\']lecture-name[^>]+>([^<]+)')
+_COURSE_TITLE_RES = tuple(re.compile(p) for p in (
+    r'(?s)<img[^>]+class=["\']course-image[^>]+>\s*<h\d>(.+?)</h',
+    r'(?s)<h\d[^>]+class=["\']course-title[^>]+>(.+?)</h'))
+
 
 class TeachableBaseIE(InfoExtractor):
     _NETRC_MACHINE = 'teachable'
@@ -31,11 +58,12 @@ class TeachableBaseIE(InfoExtractor):
 
     _VALID_URL_SUB_TUPLE = (_URL_PREFIX, '|'.join(re.escape(site) for site in _SITES.keys()))
 
-    def _real_initialize(self):
-        self._logged_in = False
+    # Session cookies live in each YoutubeDL's cookiejar, so track logins per downloader
+    _logged_in_sites = weakref.WeakKeyDictionary()
 
     def _login(self, site):
-        if self._logged_in:
+        logged_in_sites = self._logged_in_sites.setdefault(self._downloader, set())
+        if site in logged_in_sites:
             return
 
         username, password = self._get_login_info(netrc_machine=self._SITES.get(site, site))
@@ -47,13 +75,10 @@ def _login(self, site):
             'Downloading %s login page' % site)
 
         def is_logged(webpage):
-            return any(re.search(p, webpage) for p in (
-                r'class=["\']user-signout',
-                r'<a[^>]+\bhref=["\']/sign_out',
-                r'Log\s+[Oo]ut\s*<'))
+            return _IS_LOGGED_RE.search(webpage) is not None
 
         if is_logged(login_page):
-            self._logged_in = True
+            logged_in_sites.add(site)
             return
 
         login_url = urlh.geturl()
@@ -66,7 +91,7 @@ def is_logged(webpage):
         })
 
         post_url = self._search_regex(
-            r'<form[^>]+action=(["\'])(?P<url>(?:(?!\1).)+)\1', login_page,
+            _LOGIN_FORM_ACTION_RE, login_page,
             'post url', default=login_url, group='url')
 
         if not post_url.startswith('http'):
@@ -75,10 +100,7 @@ def is_logged(webpage):
         response = self._download_webpage(
             post_url, None, 'Logging in to %s' % site,
             data=urlencode_postdata(login_form),
-            headers={
-                'Content-Type': 'application/x-www-form-urlencoded',
-                'Referer': login_url,
-            })
+            headers={**_LOGIN_HEADERS_TEMPLATE, 'Referer': login_url})
 
         if '>I accept the new Privacy Policy<' in response:
             raise ExtractorError(
@@ -87,7 +109,7 @@ def is_logged(webpage):
 
         # Successful login
         if is_logged(response):
-            self._logged_in = True
+            logged_in_sites.add(site)
             return
 
         message = get_element_by_class('alert', response)
@@ -136,15 +158,13 @@ class TeachableIE(TeachableBaseIE):
 
     @staticmethod
     def _is_teachable(webpage):
-        return 'teachableTracker.linker:autoLink' in webpage and re.search(
-            r'<link[^>]+href=["\']https?://(?:process\.fs|assets)\.teachablecdn\.com',
-            webpage)
+        return 'teachableTracker.linker:autoLink' in webpage and _TEACHABLE_CDN_RE.search(webpage)
 
     @staticmethod
     def _extract_url(webpage, source_url):
         if not TeachableIE._is_teachable(webpage):
             return
-        if re.match(r'https?://[^/]+/(?:courses|p)', source_url):
+        if _COURSE_URL_RE.match(source_url):
             return '%s%s' % (TeachableBaseIE._URL_PREFIX, source_url)
 
     def _real_extract(self, url):
@@ -162,13 +182,7 @@ def _real_extract(self, url):
 
         wistia_urls = WistiaIE._extract_urls(webpage)
         if not wistia_urls:
-            if any(re.search(p, webpage) for p in (
-                    r'class=["\']lecture-contents-locked',
-                    r'>\s*Lecture contents locked',
-                    r'id=["\']lecture-locked',
-                    # https://academy.tailoredtutors.co.uk/courses/108779/lectures/1955313
-                    r'class=["\'](?:inner-)?lesson-locked',
-                    r'>LESSON LOCKED<')):
+            if _LECTURE_LOCKED_RE.search(webpage):
                 self.raise_login_required('Lecture contents locked')
             raise ExtractorError('Unable to find video URL')
 
@@ -177,22 +191,21 @@ def _real_extract(self, url):
         chapter = None
         chapter_number = None
         section_item = self._search_regex(
-            r'(?s)(?P<li><li[^>]+\bdata-lecture-id=["\']%s[^>]+>.+?</li>)' % video_id,
+            r'(?s)(?P<li><li[^>]+\bdata-lecture-id=["\']%s["\'][^>]*>.+?</li>)' % video_id,
             webpage, 'section item', default=None, group='li')
         if section_item:
             chapter_number = int_or_none(self._search_regex(
-                r'data-ss-position=["\'](\d+)', section_item, 'section id',
+                _SECTION_POSITION_RE, section_item, 'section id',
                 default=None))
             if chapter_number is not None:
                 sections = []
-                for s in re.findall(
-                        r'(?s)<div[^>]+\bclass=["\']section-title[^>]+>(.+?)</div>', webpage):
+                for s in _SECTION_TITLE_RE.findall(webpage):
                     section = strip_or_none(clean_html(s))
                     if not section:
                         sections = []
                         break
                     sections.append(section)
-                if chapter_number <= len(sections):
+                if 0 < chapter_number <= len(sections):
                     chapter = sections[chapter_number - 1]
 
         entries = [{
@@ -244,52 +257,43 @@ def suitable(cls, url):
         return False if TeachableIE.suitable(url) else super(
             TeachableCourseIE, cls).suitable(url)
 
-    def _real_extract(self, url):
-        mobj = self._match_valid_url(url)
-        site = mobj.group('site') or mobj.group('site_t')
-        course_id = mobj.group('id')
-
-        self._login(site)
-
-        prefixed = url.startswith(self._URL_PREFIX)
-        if prefixed:
-            prefix = self._URL_PREFIX
-            url = url[len(prefix):]
-
-        webpage = self._download_webpage(url, course_id)
-
+    def _entries(self, webpage, site, prefixed):
         url_base = 'https://%s/' % site
-
-        entries = []
-
-        for mobj in re.finditer(
-                r'(?s)(?P<li><li[^>]+class=(["\'])(?:(?!\2).)*?section-item[^>]+>.+?</li>)',
-                webpage):
+        for mobj in _COURSE_LI_RE.finditer(webpage):
             li = mobj.group('li')
-            if 'fa-youtube-play' not in li and not re.search(r'\d{1,2}:\d{2}', li):
+            if 'fa-youtube-play' not in li and not _TIMESTAMP_RE.search(li):
                 continue
             lecture_url = self._search_regex(
-                r'<a[^>]+href=(["\'])(?P<url>(?:(?!\1).)+)\1', li,
-                'lecture url', default=None, group='url')
+                _LECTURE_LINK_RE, li, 'lecture url', default=None, group='url')
             if not lecture_url:
                 continue
             lecture_id = self._search_regex(
-                r'/lectures/(\d+)', lecture_url, 'lecture id', default=None)
+                _LECTURE_ID_RE, lecture_url, 'lecture id', default=None)
             title = self._html_search_regex(
-                r'<span[^>]+class=["\']lecture-name[^>]+>([^<]+)', li,
-                'title', default=None)
+                _LECTURE_NAME_RE, li, 'title', default=None)
             entry_url = urljoin(url_base, lecture_url)
             if prefixed:
                 entry_url = self._URL_PREFIX + entry_url
-            entries.append(
-                self.url_result(
-                    entry_url,
-                    ie=TeachableIE.ie_key(), video_id=lecture_id,
-                    video_title=clean_html(title)))
+            yield self.url_result(
+                entry_url,
+                ie=TeachableIE.ie_key(), video_id=lecture_id,
+                video_title=clean_html(title))
+
+    def _real_extract(self, url):
+        mobj = self._match_valid_url(url)
+        site = mobj.group('site') or mobj.group('site_t')
+        course_id = mobj.group('id')
+
+        self._login(site)
+
+        prefixed = url.startswith(self._URL_PREFIX)
+        if prefixed:
+            url = url[len(self._URL_PREFIX):]
+
+        webpage = self._download_webpage(url, course_id)
 
         course_title = self._html_search_regex(
-            (r'(?s)<img[^>]+class=["\']course-image[^>]+>\s*<h\d>(.+?)</h',
-             r'(?s)<h\d[^>]+class=["\']course-title[^>]+>(.+?)</h'),
-            webpage, 'course title', fatal=False)
+            _COURSE_TITLE_RES, webpage, 'course title', fatal=False)
 
-        return self.playlist_result(entries, course_id, course_title)
+        return self.playlist_result(
+            self._entries(webpage, site, prefixed), course_id, course_title)